@@ -0,0 +1,94 @@
+# src/crawler.py
+
+import asyncio
+from tqdm import tqdm
+
+from fetcher import fetch_page
+from parser import extract_links, find_next_page
+from extractor import extract_festival_info
+from storage import save_record, save_state, load_state
+
+
+async def fetch_batch(queue, visited, max_depth, output_file, batch_size=10):
+    processed_batch = 0
+    festivals_count = 0
+    errors_count = 0
+
+    with tqdm(total=min(len(queue), batch_size), desc="Crawling") as progress:
+        batch_tasks = []
+        batch_urls = []
+
+        while queue and len(batch_tasks) < batch_size:
+            url, depth = queue.pop(0)
+            if url in visited or depth >= max_depth:
+                continue
+
+            visited.add(url)
+            batch_urls.append((url, depth))
+            batch_tasks.append(fetch_page(url))
+            processed_batch += 1
+
+        if batch_tasks:
+            results = await asyncio.gather(*batch_tasks, return_exceptions=True)
+            for (url, depth), result in zip(batch_urls, results):
+                try:
+                    if isinstance(result, Exception):
+                        raise result
+
+                    status, html = result
+                    if status == 200 and html:
+                        info = extract_festival_info(html, url)
+                        if info:
+                            info['source_url'] = url
+                            info['depth'] = depth
+                            save_record(info, output_file)
+                            festivals_count += 1
+
+                        for link in extract_links(html, url):
+                            if link not in visited and link not in [u for u, _ in queue]:
+                                queue.append((link, depth + 1))
+
+                        next_page = find_next_page(html, url)
+                        if next_page and next_page not in visited and next_page not in [u for u, _ in queue]:
+                            queue.insert(0, (next_page, depth))
+
+                except Exception as e:
+                    errors_count += 1
+                    print(f"⚠️  Error processing {url}: {e}")
+                    save_state(
+                        {'url': url, 'error': str(e), 'depth': depth},
+                        f"{output_file}.errors.jsonl"
+                    )
+
+                progress.update(1)
+
+    return processed_batch, festivals_count, errors_count, queue, visited
+
+
+async def crawl_async(seeds_file, state_file, output_file, max_depth=3, batch_size=10):
+    state = load_state(state_file) or {}
+    visited = set(state.get('visited', []))
+    queue = state.get('queue', [])
+    festivals = state.get('festivals', 0)
+    errors = state.get('errors', 0)
+
+    if not queue:
+        with open(seeds_file, 'r', encoding='utf-8') as f:
+            queue = [(url.strip(), 0) for url in f if url.strip()]
+
+    processed, new_fests, new_errs, queue, visited = await fetch_batch(
+        queue, visited, max_depth, output_file, batch_size
+    )
+    festivals += new_fests
+    errors += new_errs
+
+    save_state({
+        'visited': list(visited),
+        'queue': queue,
+        'festivals': festivals,
+        'errors': errors
+    }, state_file)
+
+    print(f"🔍 Batch done: {processed} pages, {new_fests} festivals, {new_errs} errors.")
+    print(f"⏳ {len(queue)} URLs left in queue.")
+    return processed
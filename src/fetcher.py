@@ -4,11 +4,6 @@ import asyncio
 import aiohttp  # type: ignore
 from typing import Tuple
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-
 
 async def fetch_page(
     url: str,
@@ -41,7 +36,14 @@ async def fetch_page(
 def fetch_with_selenium(url: str) -> Tuple[int, str]:
     """
     Fallback fetch using Selenium (headless Chrome).
+    Selenium and webdriver-manager are imported here, not at module load,
+    so runs that never hit the fallback don't pay for them.
     """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
     options = Options()
     options.add_argument('--headless')
     options.add_argument('--disable-gpu')
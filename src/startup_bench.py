@@ -0,0 +1,122 @@
+# src/startup_bench.py
+#
+# Startup benchmark for the CLI, based on `python -X importtime`.
+# Run directly (`python src/startup_bench.py`) or via `python src/cli.py bench`.
+# Exits non-zero when a command goes over budget or loads a heavy module.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+CLI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cli.py')
+
+# Commands that must start fast: they only parse arguments.
+# No arguments at all is the legacy path that prints help.
+COMMANDS = [
+    [],
+    ['--help'],
+    ['run', '--help'],
+    ['test', '--help'],
+    ['bench', '--help'],
+]
+
+# Modules that must never be imported just to parse arguments.
+HEAVY_MODULES = (
+    'selenium', 'webdriver_manager', 'aiohttp', 'bs4', 'dateutil', 'tqdm',
+    'fetcher', 'parser', 'extractor', 'storage', 'crawler', 'asyncio',
+)
+
+# Import time allowed on top of a bare interpreter, in milliseconds.
+DEFAULT_BUDGET_MS = 40.0
+
+
+def import_profile(args):
+    """
+    Run the interpreter with -X importtime and return
+    (total top-level import time in ms, set of imported top-level packages,
+    error). error is None on a clean exit, else the tail of stderr.
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + args,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    total_us = 0
+    modules = set()
+    other = []
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:'):
+            other.append(line)
+            continue
+        if 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.add(name.strip().split('.')[0])
+        # Top-level imports have exactly one space after the bar;
+        # nested ones are indented by two more per level.
+        if not name.startswith('  '):
+            total_us += int(cumulative)
+    error = None
+    if proc.returncode != 0:
+        tail = '\n'.join(other[-10:])
+        error = f"exit status {proc.returncode}\n{tail}"
+    return total_us / 1000.0, modules, error
+
+
+def median_profile(args, repeat):
+    runs = [import_profile(args) for _ in range(repeat)]
+    modules = set().union(*(m for _, m, _ in runs))
+    error = next((e for _, _, e in runs if e), None)
+    return statistics.median(t for t, _, _ in runs), modules, error
+
+
+def run_benchmark(budget_ms=None, repeat=5):
+    """
+    Time each fast-path command against a bare interpreter and check it
+    against the budget. Returns 0 if all commands pass, 1 otherwise.
+    """
+    if budget_ms is None:
+        budget_ms = DEFAULT_BUDGET_MS
+    repeat = max(1, repeat)
+
+    baseline_ms, baseline_mods, _ = median_profile(['-c', 'pass'], repeat)
+    print(f"⏱  Bare interpreter imports: {baseline_ms:.1f} ms (budget +{budget_ms:.1f} ms)")
+
+    failed = False
+    for cmd in COMMANDS:
+        total_ms, mods, error = median_profile([CLI_PATH] + cmd, repeat)
+        delta_ms = total_ms - baseline_ms
+        heavy = sorted(m for m in mods - baseline_mods if m in HEAVY_MODULES)
+        label = ' '.join(['cli.py'] + cmd)
+        if error:
+            failed = True
+            print(f"  ✗ {label}: failed with {error}")
+        elif heavy:
+            failed = True
+            print(f"  ✗ {label}: loads heavy modules: {', '.join(heavy)}")
+        elif delta_ms > budget_ms:
+            failed = True
+            print(f"  ✗ {label}: +{delta_ms:.1f} ms over interpreter, budget {budget_ms:.1f} ms")
+        else:
+            print(f"  ✓ {label}: +{delta_ms:.1f} ms")
+
+    if failed:
+        print("❌ Startup budget exceeded")
+        return 1
+    print("✅ Startup within budget")
+    return 0
+
+
+def main():
+    p = argparse.ArgumentParser(description="CLI startup import-time benchmark")
+    p.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                   help='Max import time over a bare interpreter, in ms')
+    p.add_argument('--repeat', type=int, default=5, help='Runs per command (median is used)')
+    args = p.parse_args()
+    return run_benchmark(args.budget_ms, args.repeat)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
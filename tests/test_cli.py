@@ -0,0 +1,76 @@
+# tests/test_cli.py
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pytest
+
+import cli
+import startup_bench
+
+
+def parse(argv):
+    return cli.build_parser().parse_args(argv)
+
+
+@pytest.mark.parametrize('argv, func, continuous', [
+    (['test'], cli.run_tests, False),
+    (['run'], cli.run_crawl, False),
+    (['run', '--continuous'], cli.run_crawl, True),
+    (['bench'], cli.run_bench, False),
+])
+def test_subcommands(argv, func, continuous):
+    args = parse(argv)
+    assert args.func is func
+    assert args.continuous is continuous
+
+
+def test_run_options():
+    args = parse(['run', '--seeds', 'x.txt', '--max-depth', '5', '--batch-size', '2'])
+    assert (args.seeds, args.max_depth, args.batch_size) == ('x.txt', 5, 2)
+    assert (args.state, args.output) == ('state.json', 'data.jsonl')
+
+
+def test_options_before_subcommand_are_kept():
+    args = parse(['--seeds', 'x.txt', 'run'])
+    assert args.seeds == 'x.txt'
+    args = parse(['--max-depth', '5', 'run', '--continuous'])
+    assert args.max_depth == 5
+    assert args.continuous is True
+
+
+@pytest.mark.parametrize('argv, test, run, continuous', [
+    (['--test'], True, False, False),
+    (['--run'], False, True, False),
+    (['--continuous'], False, False, True),
+    (['--run', '--continuous'], False, True, True),
+])
+def test_legacy_flags(argv, test, run, continuous):
+    args = parse(argv)
+    assert args.command is None
+    assert (args.test, args.run, args.continuous) == (test, run, continuous)
+
+
+def test_legacy_run_options():
+    args = parse(['--run', '--seeds', 'x.txt', '--output', 'out.jsonl'])
+    assert args.run is True
+    assert (args.seeds, args.output) == ('x.txt', 'out.jsonl')
+
+
+def test_legacy_dispatch(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, 'run_tests', lambda args: calls.append('test'))
+    monkeypatch.setattr(cli, 'run_crawl', lambda args: calls.append(('run', args.seeds)))
+    assert cli.main(['--test']) == 0
+    assert cli.main(['--run', '--seeds', 'x.txt']) == 0
+    assert cli.main(['--continuous']) == 0
+    assert calls == ['test', ('run', 'x.txt'), ('run', 'seeds.txt')]
+
+
+@pytest.mark.parametrize('cmd', startup_bench.COMMANDS)
+def test_startup_skips_heavy_modules(cmd):
+    _, modules, error = startup_bench.import_profile([startup_bench.CLI_PATH] + cmd)
+    assert error is None
+    assert not modules & set(startup_bench.HEAVY_MODULES)